@@ -34,38 +34,46 @@ def random_grid_generator():
     return ss.solve(solved_sudoku)
 
 
-def removable(cell, sudoku):
+def removable(cell, sudoku, deadline=None, max_nodes=None, stats=None):
     """
     checks if a cell can be removed from the grid keeping it valid (no
     multiple solutions).
     :param cell:
     :param sudoku:
-    :param level:
+    :param deadline, max_nodes, stats: the search limits (see ss.solve)
     :return: bool
     """
     sudoku_temp = sudoku.copy()
     sudoku_temp[cell] = '123456789'
-    if ss.solve(sudoku_temp)[1] == 'VALID':
+    if ss.solve(sudoku_temp, deadline, max_nodes, stats)[1] == 'VALID':
         return True
 
 
-def generate_sudoku(sudoku):
+def generate_sudoku(sudoku, deadline=None, max_nodes=None, stats=None):
     """
     Considers all the cells in random order. If the sudoku is still
     valid after removal, the cell is removed. If not, it is ignored.
+    The node budget is shared by all the removal checks. When a limit
+    is reached, the remaining cells are kept: the grid still has a
+    single solution but fewer cells are removed.
     :param sudoku: complete grid
-    :return sudoku: modified grid
+    :param deadline, max_nodes, stats: the search limits (see ss.solve)
+    :return sudoku, status: modified grid, 'VALID' or 'TIMEOUT'
     """
+    if stats is None:
+        stats = ss.new_stats()
     cells = [*sudoku]
     removed_cells = []
     shuffle(cells)
     for cell in cells:
-        if removable(cell, sudoku):
+        if removable(cell, sudoku, deadline, max_nodes, stats):
             removed_cells.append(cell)
             sudoku[cell] = '123456789'
+        if ss.budget_exceeded(deadline, max_nodes, stats):
+            return sudoku, 'TIMEOUT'
     # for cell in removed_cells:
     #     sudoku[cell] = ' '
-    return sudoku
+    return sudoku, 'VALID'
 
 
 def grid_to_latex(sudoku, param=0):
@@ -23,8 +23,14 @@ s_0 = ['479030102', '012670900', '000010704',
 which will be transformed into a dictionary:
 sudoku = {'A1': '4', 'A2': '7', ...}
 
+The search may be bounded by a deadline (a time.monotonic() value)
+and/or a maximum number of search nodes. When a limit is reached,
+the status 'TIMEOUT' is returned with the partially resolved grid and
+the search statistics are left in the stats dictionary.
+
 """
 from itertools import combinations
+import time
 
 
 #######################################################################
@@ -320,6 +326,38 @@ def validate(sudoku):
     return 'UNDEFINED'
 
 
+#######################################################################
+# Search limits and statistics
+#######################################################################
+
+
+def new_stats():
+    """
+    Creates the dictionary used to follow the search. It is shared by
+    all the recursive calls so the node budget applies to the whole
+    search.
+    :return stats: a dictionary of search statistics
+    """
+    return {'nodes': 0, 'depth': 0, 'max_depth': 0,
+            'start': time.monotonic(), 'elapsed': 0.0}
+
+
+def budget_exceeded(deadline=None, max_nodes=None, stats=None):
+    """
+    Checks if the search must be interrupted
+    :param deadline: time.monotonic() value after which to stop
+    :param max_nodes: maximum number of search nodes
+    :param stats: the search statistics dictionary
+    :return bool: True if a limit has been reached
+    """
+    if deadline is not None and time.monotonic() >= deadline:
+        return True
+    if max_nodes is not None and stats is not None and \
+            stats['nodes'] >= max_nodes:
+        return True
+    return False
+
+
 #######################################################################
 # Logical test 1
 #######################################################################
@@ -379,15 +417,18 @@ def logic_2(sudoku):
 #######################################################################
 # Logical test 3
 #######################################################################
-def logic_3(sudoku):
+def logic_3(sudoku, deadline=None):
     """
     checks every row, column and box for cell group for which possible
     values matches the number of cells. These possible values may then
     be removed from all the other cells of the group
     :param sudoku: a sudoku dictionary
+    :param deadline: time.monotonic() value after which to stop
     """
     groups = get_groups()[0] + get_groups()[1] + get_groups()[2]
     for group in groups:
+        if budget_exceeded(deadline):
+            return
         unsolved_cells = []
         permutations = []
         for cell in group:
@@ -460,18 +501,21 @@ def logic_4(sudoku):
 #######################################################################
 # Logic tests application
 #######################################################################
-def logic_tests(sudoku):
+def logic_tests(sudoku, deadline=None):
     """
     Applies the three logic tests as long as the sudoku is progressing
     :param sudoku: a sudoku dictionary
+    :param deadline: time.monotonic() value after which to stop
     : return sudoku, valid, solved:
     """
     status = validate(sudoku)
     state_i, state = 729, progression(sudoku)
     while state_i > state and status == 'UNDEFINED':
+        if budget_exceeded(deadline):
+            return sudoku, 'TIMEOUT'
         logic_1(sudoku)
         logic_2(sudoku)
-        logic_3(sudoku)
+        logic_3(sudoku, deadline)
         logic_4(sudoku)
         state_i = state
         state = progression(sudoku)
@@ -482,18 +526,45 @@ def logic_tests(sudoku):
 #######################################################################
 # Cycling through the unsolved cells
 #######################################################################
-def solve(sudoku):
+def solve(sudoku, deadline=None, max_nodes=None, stats=None):
     """
     Recieves the partially resolved grid and branch on the smallest
     cell, copy the sudoku, fix the value of the smallest cell to its
     different possibilities and applies logic tests. If the grid is
     still unresolved, proceed with another cell, until the sudoku is
-    solved.
+    solved. If the deadline or the node budget is reached, the search
+    stops and the grid of the interrupted level is returned with the
+    status 'TIMEOUT'.
+    :param sudoku:
+    :param deadline: time.monotonic() value after which to stop
+    :param max_nodes: maximum number of search nodes
+    :param stats: dictionary from new_stats(), updated during search
+    :return sudoku, solved:
+    """
+    if stats is None:
+        stats = new_stats()
+    if budget_exceeded(deadline, max_nodes, stats):
+        return sudoku, 'TIMEOUT'
+    stats['nodes'] += 1
+    stats['depth'] += 1
+    stats['max_depth'] = max(stats['max_depth'], stats['depth'])
+    try:
+        return branch_on(sudoku, deadline, max_nodes, stats)
+    finally:
+        stats['depth'] -= 1
+        stats['elapsed'] = time.monotonic() - stats['start']
+
+
+def branch_on(sudoku, deadline, max_nodes, stats):
+    """
+    Search step of solve: applies logic tests, then tries every value
+    of the smallest cell
     :param sudoku:
+    :param deadline, max_nodes, stats: the search limits (see solve)
     :return sudoku, solved:
     """
     solution_found = 0
-    sudoku, status = logic_tests(sudoku)
+    sudoku, status = logic_tests(sudoku, deadline)
     if status != 'UNDEFINED':
         return sudoku, status
     else:
@@ -501,8 +572,11 @@ def solve(sudoku):
         for d in sudoku[branch]:
             new_sudoku = sudoku.copy()
             new_sudoku[branch] = d
-            sudoku_end, status = solve(new_sudoku)
-            if status == 'MULTIPLE SOLUTIONS':
+            sudoku_end, status = solve(new_sudoku, deadline, max_nodes,
+                                       stats)
+            if status == 'TIMEOUT':
+                return sudoku, status
+            elif status == 'MULTIPLE SOLUTIONS':
                 return sudoku_end, status
             elif status == 'VALID':
                 sudoku_solved = sudoku_end.copy()
@@ -516,10 +590,20 @@ def solve(sudoku):
     return sudoku, 'UNSOLVED'
 
 
-def eval_level(sudoku):
+def eval_level(sudoku, deadline=None, max_nodes=None, stats=None):
+    """
+    Evaluates the difficulty from the logic tests needed to solve the
+    sudoku. Returns 'TIMEOUT' if the deadline or the node budget is
+    reached before the level is known.
+    :param sudoku: a sudoku dictionary, modified in place
+    :param deadline, max_nodes, stats: the search limits (see solve)
+    :return level: 'facile', 'moyen', 'difficile' or 'TIMEOUT'
+    """
     status = validate(sudoku)
     state_i, state = 729, progression(sudoku)
     while state_i > state and status == 'UNDEFINED':
+        if budget_exceeded(deadline):
+            return 'TIMEOUT'
         logic_1(sudoku)
         logic_2(sudoku)
         state_i = state
@@ -528,11 +612,15 @@ def eval_level(sudoku):
     if status == 'VALID':
         return 'facile'
     else:
-        sudoku, status = logic_tests(sudoku)
+        sudoku, status = logic_tests(sudoku, deadline)
     if status == 'VALID':
         return 'moyen'
+    elif status == 'TIMEOUT':
+        return 'TIMEOUT'
     else:
-        sudoku, status = solve(sudoku)
+        sudoku, status = solve(sudoku, deadline, max_nodes, stats)
+        if status == 'TIMEOUT':
+            return 'TIMEOUT'
         return 'difficile'
 
 